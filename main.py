@@ -5,7 +5,6 @@ import time
 from PIL import Image
 import pystray
 from pystray import MenuItem as item
-from pynput.keyboard import Key
 
 # Project Modules
 from src import config
@@ -41,8 +40,8 @@ class GestureApp(ctk.CTk):
         self.cap = None
         self.is_camera_loading = False
 
-        # Media control interface
-        self.media_ctrl = MediaInterface()
+        # Media control interface (backend messages arrive from a worker thread)
+        self.media_ctrl = MediaInterface(log=lambda msg: self.after(0, self.log, msg))
 
         # Gesture and mode state
         self.lock_mode = True
@@ -182,6 +181,7 @@ class GestureApp(ctk.CTk):
     def quit_app_fully(self):
         """Fully shuts down the application."""
         self.stop_camera()
+        self.media_ctrl.close()
         self.destroy()
 
     def log(self, msg):
@@ -439,7 +439,7 @@ class GestureApp(ctk.CTk):
 
             if y < config.VOLUME_TOP_THRESH:
                 self.media_ctrl.execute_command(
-                    Key.media_volume_up, "up", config.VOLUME_COOLDOWN
+                    "volume_up", config.VOLUME_COOLDOWN
                 )
                 if self.volume_state != "INCREASING":
                     self.log("Volume Increasing...")
@@ -447,7 +447,7 @@ class GestureApp(ctk.CTk):
 
             elif y > config.VOLUME_BOTTOM_THRESH:
                 self.media_ctrl.execute_command(
-                    Key.media_volume_down, "down", config.VOLUME_COOLDOWN
+                    "volume_down", config.VOLUME_COOLDOWN
                 )
                 if self.volume_state != "DECREASING":
                     self.log("Volume Decreasing...")
@@ -467,7 +467,7 @@ class GestureApp(ctk.CTk):
 
             if self.gun_frames >= config.GUN_FRAME_REQ:
                 self.media_ctrl.execute_command(
-                    Key.media_play_pause, "pp", 0.1
+                    "play_pause", 0.1
                 )
                 self.log("Action: Play / Pause")
                 self.gun_frames = 0
@@ -486,12 +486,12 @@ class GestureApp(ctk.CTk):
                 if self.stable_frames >= config.GESTURE_STABLE_REQ:
                     if pose == "TWO_FINGERS":
                         self.media_ctrl.execute_command(
-                            Key.media_next, "next", 0.1
+                            "next", 0.1
                         )
                         self.log("Action: Next Track")
                     else:
                         self.media_ctrl.execute_command(
-                            Key.media_previous, "prev", 0.1
+                            "previous", 0.1
                         )
                         self.log("Action: Previous Track")
 
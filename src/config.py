@@ -16,6 +16,13 @@ GESTURE_STABLE_REQ = 4      # Frames to confirm 'Next/Prev' gestures
 VOLUME_TOP_THRESH = 0.35    # Above this line -> Volume Up
 VOLUME_BOTTOM_THRESH = 0.65 # Below this line -> Volume Down
 VOLUME_COOLDOWN = 0.05      # Speed of volume change
+VOLUME_STEP = 0.02          # Absolute volume change per step (MPRIS backend)
 
 # Auto-Lock
-AUTO_LOCK_TIMEOUT = 1.2     # Seconds before locking if hand is lost
\ No newline at end of file
+AUTO_LOCK_TIMEOUT = 1.2     # Seconds before locking if hand is lost
+
+# Media Backend
+MEDIA_BACKEND = "auto"          # "auto", "keyboard" or "mpris" (Linux)
+MPRIS_PLAYER = None             # Player name (e.g. "spotify"), None = first found
+MPRIS_BUS_ADDRESS = None        # D-Bus address, None = session bus
+MPRIS_VOLUME_TARGET = "system"  # "system" (PulseAudio/PipeWire) or "player"
\ No newline at end of file
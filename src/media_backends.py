@@ -0,0 +1,360 @@
+import queue
+import sys
+import threading
+import time
+
+# Optional Linux dependencies (MPRIS backend only)
+try:
+    from jeepney import DBusAddress, Properties, new_method_call
+    from jeepney.bus_messages import message_bus
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import DBusErrorResponse, unwrap_msg
+except ImportError:
+    open_dbus_connection = None
+
+# pulsectl raises OSError at import time when libpulse is missing
+try:
+    import pulsectl
+    PULSE_ERRORS = (pulsectl.PulseError, pulsectl.PulseDisconnected)
+except (ImportError, OSError):
+    pulsectl = None
+    PULSE_ERRORS = ()
+
+
+class KeyboardBackend:
+    """Sends media actions as synthetic media keystrokes (all platforms)."""
+
+    name = "keyboard"
+
+    def __init__(self):
+        from pynput.keyboard import Controller, Key
+
+        self.keyboard = Controller()
+        self.key_map = {
+            "play_pause": Key.media_play_pause,
+            "next": Key.media_next,
+            "previous": Key.media_previous,
+            "volume_up": Key.media_volume_up,
+            "volume_down": Key.media_volume_down,
+        }
+
+    def send(self, action):
+        """Presses and releases the media key mapped to the action."""
+        key = self.key_map[action]
+        self.keyboard.press(key)
+        self.keyboard.release(key)
+
+    def close(self):
+        pass
+
+
+class MprisBackend:
+    """
+    Talks directly to MPRIS media players over D-Bus (Linux).
+
+    Keeps a persistent bus connection owned by a worker thread, so the
+    frame loop only enqueues requests and never waits on D-Bus. Volume
+    steps are coalesced into a single absolute set-volume call, applied
+    either to the PulseAudio/PipeWire default sink or to the player.
+    """
+
+    name = "mpris"
+
+    MPRIS_PREFIX = "org.mpris.MediaPlayer2."
+    MPRIS_PATH = "/org/mpris/MediaPlayer2"
+    PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
+
+    PLAYER_METHODS = {
+        "play_pause": "PlayPause",
+        "next": "Next",
+        "previous": "Previous",
+    }
+
+    # Re-read the real volume after this many idle seconds, so changes
+    # made outside the app are not overwritten by a stale cached value
+    VOLUME_CACHE_TTL = 1.0
+
+    def __init__(self, player=None, bus_address=None, volume_target="system",
+                 volume_step=0.02, timeout=1.0, fallback=None, log=print):
+        """
+        Args:
+            player: Preferred player bus name suffix (e.g. "spotify").
+                    None targets the first player found on the bus.
+            bus_address: D-Bus address to connect to. None uses the
+                         session bus.
+            volume_target: "system" for the default audio sink,
+                           "player" for the MPRIS player volume.
+            volume_step: Absolute volume change (0.0 - 1.0) per step.
+            timeout: Seconds to wait for a D-Bus reply.
+            fallback: Backend used when no MPRIS player is found.
+            log: Callable receiving status and error messages. Called
+                 from the worker thread.
+        """
+        if open_dbus_connection is None:
+            raise RuntimeError("jeepney is not installed")
+
+        self.player = player
+        self.volume_step = volume_step
+        self.timeout = timeout
+        self.fallback = fallback
+        self.log = log
+        self.last_message = None
+
+        # Connect eagerly so an unavailable bus fails at startup; the
+        # worker reconnects lazily if the connection drops later
+        self.bus_address = bus_address or "SESSION"
+        self.conn = open_dbus_connection(bus=self.bus_address)
+        self.bus_name = None
+
+        # Pulse connection and default sink are opened lazily by the worker
+        self.use_pulse = volume_target == "system"
+        self.pulse = None
+        self.sink = None
+        if self.use_pulse and pulsectl is None:
+            self.use_pulse = False
+            self.log("pulsectl not installed, using player volume")
+
+        # Pending volume change, applied by the worker in one call
+        self.lock = threading.Lock()
+        self.volume_delta = 0.0
+        self.volume_pending = False
+        self.cached_volume = None
+        self.cached_volume_ts = 0
+
+        self.jobs = queue.Queue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    # --------------------------------------------------
+    # PUBLIC API (called from the UI thread)
+    # --------------------------------------------------
+
+    def send(self, action):
+        """Queues the action for the worker thread and returns immediately."""
+        if action in ("volume_up", "volume_down"):
+            step = self.volume_step if action == "volume_up" else -self.volume_step
+            with self.lock:
+                self.volume_delta += step
+                if self.volume_pending:
+                    return
+                self.volume_pending = True
+            self.jobs.put("volume")
+        else:
+            self.jobs.put(action)
+
+    def close(self):
+        """Stops the worker thread, which closes its own connections."""
+        self.jobs.put(None)
+        self.worker.join(timeout=self.timeout)
+        if self.fallback:
+            self.fallback.close()
+
+    # --------------------------------------------------
+    # WORKER THREAD
+    # --------------------------------------------------
+
+    def _run(self):
+        """Processes queued actions over the persistent connection."""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self._close_connections()
+                return
+
+            try:
+                if job == "volume":
+                    self._apply_volume()
+                else:
+                    self._call_player(job)
+            except Exception as e:
+                self._reset_after_error(e)
+                self._report(f"MPRIS action '{job}' failed: {e}")
+
+    def _reset_after_error(self, error):
+        """Drops cached state so the next action rediscovers it."""
+        # Player may have exited
+        self.bus_name = None
+        self.cached_volume = None
+        if isinstance(error, ConnectionError):
+            # Bus connection dropped; reopen on the next request
+            self._close_bus()
+        if isinstance(error, PULSE_ERRORS):
+            # Audio server restarted; reconnect on the next volume job
+            self._close_pulse()
+
+    def _close_connections(self):
+        self._close_bus()
+        self._close_pulse()
+
+    def _close_bus(self):
+        if self.conn:
+            try:
+                self.conn.close()
+            except:
+                pass
+            self.conn = None
+
+    def _close_pulse(self):
+        if self.pulse:
+            try:
+                self.pulse.close()
+            except:
+                pass
+            self.pulse = None
+        self.sink = None
+
+    def _report(self, message):
+        """Logs a message, skipping repeats of the previous one."""
+        if message != self.last_message:
+            self.last_message = message
+            self.log(message)
+
+    def _request(self, msg):
+        """Sends a message and returns the reply body, raising on errors."""
+        if self.conn is None:
+            self.conn = open_dbus_connection(bus=self.bus_address)
+        reply = self.conn.send_and_get_reply(msg, timeout=self.timeout)
+        return unwrap_msg(reply)
+
+    def _find_player(self):
+        """Returns the bus name of the target MPRIS player, or None."""
+        if self.bus_name:
+            return self.bus_name
+
+        names = self._request(message_bus.ListNames())[0]
+        players = sorted(n for n in names if n.startswith(self.MPRIS_PREFIX))
+
+        if self.player:
+            wanted = self.MPRIS_PREFIX + self.player
+            players = [n for n in players if n == wanted or n.startswith(wanted + ".")]
+
+        self.bus_name = players[0] if players else None
+        if self.bus_name:
+            self._report(f"MPRIS player: {self.bus_name[len(self.MPRIS_PREFIX):]}")
+        return self.bus_name
+
+    def _player_address(self):
+        """Returns the player address, reporting when no player is running."""
+        bus_name = self._find_player()
+        if bus_name is None:
+            if self.fallback:
+                self._report("No MPRIS player found, using keyboard")
+            else:
+                self._report("No MPRIS player found")
+            return None
+        return DBusAddress(self.MPRIS_PATH, bus_name=bus_name, interface=self.PLAYER_IFACE)
+
+    def _call_player(self, action):
+        for attempt in range(2):
+            try:
+                address = self._player_address()
+                if address is None:
+                    if self.fallback:
+                        self.fallback.send(action)
+                    return
+                self._request(new_method_call(address, self.PLAYER_METHODS[action]))
+                return
+            except (DBusErrorResponse, ConnectionError) as e:
+                # Player quit or the bus dropped; rediscover and retry once
+                self._reset_after_error(e)
+                if attempt:
+                    raise
+
+    def _apply_volume(self):
+        """Applies all pending volume steps as one absolute set-volume call."""
+        with self.lock:
+            delta = self.volume_delta
+            self.volume_delta = 0.0
+            self.volume_pending = False
+
+        try:
+            applied = self._step_volume(delta)
+        except Exception as e:
+            if not self.fallback:
+                raise
+            self._reset_after_error(e)
+            self._report(f"Volume control failed ({e}), using keyboard")
+            applied = False
+
+        if not applied:
+            self._fallback_volume(delta)
+
+    def _step_volume(self, delta):
+        """Sets the volume to the cached level plus delta. False if no target."""
+        now = time.time()
+        if self.cached_volume is None or now - self.cached_volume_ts > self.VOLUME_CACHE_TTL:
+            self.cached_volume = self._get_volume()
+            if self.cached_volume is None:
+                return False
+
+        # Sinks may already be boosted above 100%; never lower them on volume up
+        upper = max(1.0, self.cached_volume)
+        volume = max(0.0, min(upper, self.cached_volume + delta))
+        self._set_volume(volume)
+        self.cached_volume = volume
+        self.cached_volume_ts = now
+        return True
+
+    def _fallback_volume(self, delta):
+        """Replays coalesced volume steps as key presses on the fallback."""
+        if not self.fallback:
+            return
+        action = "volume_up" if delta > 0 else "volume_down"
+        for _ in range(round(abs(delta) / self.volume_step)):
+            self.fallback.send(action)
+
+    def _get_volume(self):
+        if self.use_pulse:
+            # Refresh the cached sink together with the cached volume
+            pulse = self._get_pulse()
+            self.sink = pulse.get_sink_by_name(pulse.server_info().default_sink_name)
+            return self.sink.volume.value_flat
+
+        address = self._player_address()
+        if address is None:
+            return None
+        return self._request(Properties(address).get("Volume"))[0][1]
+
+    def _set_volume(self, volume):
+        if self.use_pulse:
+            # Scale every channel to keep the sink's left/right balance
+            current = self.sink.volume.value_flat
+            if current > 0:
+                values = [v * volume / current for v in self.sink.volume.values]
+            else:
+                values = [volume] * len(self.sink.volume.values)
+            self.pulse.volume_set(self.sink, pulsectl.PulseVolumeInfo(values))
+            return
+
+        address = self._player_address()
+        if address is not None:
+            self._request(Properties(address).set("Volume", "d", volume))
+
+    def _get_pulse(self):
+        if self.pulse is None:
+            self.pulse = pulsectl.Pulse("touchless-media-controller")
+        return self.pulse
+
+
+def create_backend(name="auto", log=print, **mpris_options):
+    """
+    Creates a media backend by name.
+
+    "auto" prefers MPRIS on Linux and falls back to the keyboard backend
+    when D-Bus is not available or no MPRIS player is running.
+    """
+    if name == "keyboard":
+        return KeyboardBackend()
+
+    if name == "mpris":
+        return MprisBackend(log=log, **mpris_options)
+
+    if name == "auto":
+        if sys.platform.startswith("linux"):
+            try:
+                return MprisBackend(fallback=KeyboardBackend(), log=log, **mpris_options)
+            except Exception as e:
+                log(f"MPRIS backend unavailable ({e}), using keyboard")
+        return KeyboardBackend()
+
+    raise ValueError(f"Unknown media backend: {name}")
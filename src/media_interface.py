@@ -1,24 +1,43 @@
 import time
-from pynput.keyboard import Controller, Key
+from src import config
+from src.media_backends import create_backend
 
 class MediaInterface:
-    """Handles keyboard simulation for media control."""
+    """Dispatches media actions to the configured backend."""
     
-    def __init__(self):
-        self.keyboard = Controller()
+    def __init__(self, backend=None, log=print):
+        """
+        Args:
+            backend: Backend instance. None creates the configured one.
+            log: Callable receiving backend status messages. May be
+                 called from a background thread.
+        """
+        if backend is None:
+            backend = create_backend(
+                config.MEDIA_BACKEND,
+                log=log,
+                player=config.MPRIS_PLAYER,
+                bus_address=config.MPRIS_BUS_ADDRESS,
+                volume_target=config.MPRIS_VOLUME_TARGET,
+                volume_step=config.VOLUME_STEP,
+            )
+        self.backend = backend
         self.last_action_time = {}
 
-    def execute_command(self, action_key, action_name, cooldown=0.1, log_message=None):
+    def execute_command(self, action, cooldown=0.1, log_message=None):
         """
-        Presses a key with a cooldown timer to prevent spamming.
+        Sends a media action with a cooldown timer to prevent spamming.
         """
         now = time.time()
-        last_time = self.last_action_time.get(action_name, 0)
+        last_time = self.last_action_time.get(action, 0)
         
         if now - last_time > cooldown:
-            self.keyboard.press(action_key)
-            self.keyboard.release(action_key)
-            self.last_action_time[action_name] = now
+            self.backend.send(action)
+            self.last_action_time[action] = now
             
             if log_message:
-                print(log_message)
\ No newline at end of file
+                print(log_message)
+
+    def close(self):
+        """Releases backend resources."""
+        self.backend.close()
\ No newline at end of file
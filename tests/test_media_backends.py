@@ -0,0 +1,253 @@
+import shutil
+import socket
+import subprocess
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("jeepney")
+if shutil.which("dbus-daemon") is None:
+    pytest.skip("dbus-daemon not available", allow_module_level=True)
+
+from jeepney import MessageType, new_error, new_method_return
+from jeepney.bus_messages import message_bus
+from jeepney.io.blocking import open_dbus_connection
+from jeepney.low_level import HeaderFields
+
+from src.media_backends import MprisBackend
+
+
+class FakePlayer:
+    """Minimal org.mpris.MediaPlayer2 service recording incoming calls."""
+
+    def __init__(self, address, name, volume=0.5, volume_error=False):
+        self.calls = []
+        self.volume = volume
+        self.volume_error = volume_error
+        self.release = threading.Event()
+        self.release.set()
+
+        self.conn = open_dbus_connection(bus=address)
+        self.conn.send_and_get_reply(message_bus.RequestName("org.mpris.MediaPlayer2." + name))
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                msg = self.conn.receive()
+            except Exception:
+                return
+            if msg.header.message_type != MessageType.method_call:
+                continue
+
+            member = msg.header.fields[HeaderFields.member]
+            self.calls.append((member, msg.body))
+            self.release.wait()
+
+            if member in ("Get", "Set") and self.volume_error:
+                reply = new_error(msg, "org.freedesktop.DBus.Error.NotSupported")
+            elif member == "Get":
+                reply = new_method_return(msg, "v", (("d", self.volume),))
+            elif member == "Set":
+                self.volume = msg.body[2][1]
+                reply = new_method_return(msg)
+            elif member in ("PlayPause", "Next", "Previous"):
+                reply = new_method_return(msg)
+            else:
+                reply = new_error(msg, "org.freedesktop.DBus.Error.UnknownMethod")
+            self.conn.send(reply)
+
+    def members(self):
+        return [member for member, _ in self.calls]
+
+    def close(self):
+        self.conn.close()
+
+
+class RecordingBackend:
+    """Stands in for the keyboard fallback."""
+
+    def __init__(self):
+        self.actions = []
+
+    def send(self, action):
+        self.actions.append(action)
+
+    def close(self):
+        pass
+
+
+def wait_for(predicate, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def bus_address():
+    """Starts a private D-Bus session bus for the test."""
+    proc = subprocess.Popen(
+        ["dbus-daemon", "--session", "--nofork", "--print-address=1"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    address = proc.stdout.readline().strip()
+    yield address
+    proc.terminate()
+    proc.wait()
+
+
+@pytest.fixture
+def make_backend(bus_address):
+    backends = []
+
+    def factory(**options):
+        options.setdefault("volume_target", "player")
+        options.setdefault("timeout", 5.0)
+        backend = MprisBackend(bus_address=bus_address, **options)
+        backends.append(backend)
+        return backend
+
+    yield factory
+    for backend in backends:
+        backend.close()
+
+
+def test_player_methods_are_dispatched(bus_address, make_backend):
+    player = FakePlayer(bus_address, "fake")
+    backend = make_backend()
+
+    backend.send("play_pause")
+    backend.send("next")
+    backend.send("previous")
+
+    assert wait_for(lambda: len(player.calls) == 3)
+    assert player.members() == ["PlayPause", "Next", "Previous"]
+    player.close()
+
+
+def test_volume_steps_are_coalesced(bus_address, make_backend):
+    player = FakePlayer(bus_address, "fake", volume=0.5)
+    backend = make_backend(volume_step=0.02)
+
+    # Hold the worker inside PlayPause so the volume steps queue up
+    player.release.clear()
+    backend.send("play_pause")
+    assert wait_for(lambda: player.members() == ["PlayPause"])
+    for _ in range(5):
+        backend.send("volume_up")
+    player.release.set()
+
+    assert wait_for(lambda: "Set" in player.members())
+    backend.close()
+    assert player.members() == ["PlayPause", "Get", "Set"]
+    assert player.volume == pytest.approx(0.6)
+    player.close()
+
+
+def test_volume_above_full_is_not_clamped_down(bus_address, make_backend):
+    player = FakePlayer(bus_address, "fake", volume=1.3)
+    backend = make_backend(volume_step=0.02)
+
+    backend.send("volume_up")
+    assert wait_for(lambda: "Set" in player.members())
+    assert player.volume == pytest.approx(1.3)
+
+    backend.send("volume_down")
+    assert wait_for(lambda: player.members().count("Set") == 2)
+    assert player.volume == pytest.approx(1.28)
+    player.close()
+
+
+def test_player_option_targets_named_player(bus_address, make_backend):
+    alpha = FakePlayer(bus_address, "alpha")
+    beta = FakePlayer(bus_address, "beta.instance42")
+    backend = make_backend(player="beta")
+
+    backend.send("next")
+
+    assert wait_for(lambda: beta.members() == ["Next"])
+    assert alpha.calls == []
+    alpha.close()
+    beta.close()
+
+
+def test_missing_player_uses_fallback_and_logs(bus_address, make_backend):
+    FakePlayer(bus_address, "fake")
+    fallback = RecordingBackend()
+    messages = []
+    backend = make_backend(player="nonexist", fallback=fallback, log=messages.append)
+
+    backend.send("play_pause")
+    backend.send("next")
+    assert wait_for(lambda: len(fallback.actions) == 2)
+    backend.send("volume_down")
+    backend.close()
+
+    assert fallback.actions == ["play_pause", "next", "volume_down"]
+    assert messages == ["No MPRIS player found, using keyboard"]
+
+
+def test_missing_player_without_fallback_logs(bus_address, make_backend):
+    messages = []
+    backend = make_backend(log=messages.append)
+
+    backend.send("play_pause")
+    backend.close()
+
+    assert messages == ["No MPRIS player found"]
+
+
+def test_player_quitting_uses_fallback(bus_address, make_backend):
+    player = FakePlayer(bus_address, "fake")
+    fallback = RecordingBackend()
+    backend = make_backend(fallback=fallback)
+
+    backend.send("next")
+    assert wait_for(lambda: player.members() == ["Next"])
+
+    # The cached bus name now points at a player that no longer exists
+    player.close()
+    probe = open_dbus_connection(bus=bus_address)
+    assert wait_for(lambda: not any(
+        n.startswith("org.mpris.") for n in probe.send_and_get_reply(message_bus.ListNames()).body[0]
+    ))
+    probe.close()
+    backend.send("play_pause")
+    backend.close()
+
+    assert fallback.actions == ["play_pause"]
+
+
+def test_volume_error_uses_fallback(bus_address, make_backend):
+    FakePlayer(bus_address, "fake", volume_error=True)
+    fallback = RecordingBackend()
+    messages = []
+    backend = make_backend(fallback=fallback, log=messages.append, volume_step=0.02)
+
+    backend.send("volume_up")
+    assert wait_for(lambda: fallback.actions == ["volume_up"])
+    backend.send("volume_down")
+    backend.close()
+
+    assert fallback.actions == ["volume_up", "volume_down"]
+    assert any(m.startswith("Volume control failed") for m in messages)
+
+
+def test_dropped_bus_connection_is_reopened(bus_address, make_backend):
+    player = FakePlayer(bus_address, "fake")
+    backend = make_backend()
+
+    backend.send("next")
+    assert wait_for(lambda: player.members() == ["Next"])
+
+    backend.conn.sock.shutdown(socket.SHUT_RDWR)
+    backend.send("previous")
+
+    assert wait_for(lambda: player.members() == ["Next", "Previous"])
+    player.close()